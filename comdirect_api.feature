@@ -23,7 +23,7 @@ Feature: Comdirect API Client Library
     And the library should log "INFO: Session UUID retrieved"
     And the library should create a TAN challenge
     And the library should log "INFO: TAN challenge created" with TAN type
-    And the library should poll for TAN approval every 1 second
+    And the library should poll for TAN approval with backoff from 1 up to 5 seconds
     And the library should log "DEBUG: Polling TAN status" for each poll attempt
     And the library should activate the session after TAN approval
     And the library should log "INFO: TAN approved, activating session"
@@ -124,7 +124,7 @@ Feature: Comdirect API Client Library
     And new tokens with expiry time are stored
     When the authentication completes successfully
     Then the library should start an asyncio token refresh task
-    And the library should log "INFO: Token refresh task started"
+    And the library should log "INFO: Token refresh scheduled (in {seconds}s)"
     And the task should calculate next refresh time
     And the task should schedule refresh for 2 minutes before expiry
 
@@ -374,7 +374,7 @@ Feature: Comdirect API Client Library
   Scenario: Session UUID is generated and reused throughout authentication
     Given the user triggers authentication
     When the library starts the authentication flow
-    Then a random UUID v4 should be generated for sessionId
+    Then a random 32-character hex string should be generated for sessionId
     And the sessionId should be stored for the session
     And the library should log "DEBUG: Generated session ID: {session_id_prefix}..."
     And the same sessionId should be used in all x-http-request-info headers
@@ -426,7 +426,7 @@ Feature: Comdirect API Client Library
     Then the client should start a background asyncio refresh task
     And the background task should refresh tokens 120 seconds before expiry
     And the user should NOT destroy the client after each operation
-    And the library should log "INFO: Token refresh task started"
+    And the library should log "INFO: Token refresh scheduled (in {seconds}s)"
     And consecutive API calls should reuse the same client instance
     And tokens should auto-refresh without user intervention
 
@@ -2,27 +2,35 @@
 
 Async Python client for the Comdirect Banking API with automatic token refresh.
 Uses Bravado to generate API methods from the Swagger specification.
+
+Only ``ComdirectClient`` is imported lazily (PEP 562), so ``import comdirect_client``
+does not load the client module until it is first accessed.
 """
 
-__version__ = "0.1.0"
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from comdirect_client.client import ComdirectClient
 from comdirect_client.exceptions import (
-    ComdirectAPIError,
+    AccountNotFoundError,
     AuthenticationError,
-    TANTimeoutError,
+    ComdirectAPIError,
+    NetworkTimeoutError,
+    ServerError,
     SessionActivationError,
+    TANTimeoutError,
     TokenExpiredError,
-    NetworkTimeoutError,
-    AccountNotFoundError,
     ValidationError,
-    ServerError,
 )
 from comdirect_client.token_storage import (
     TokenPersistence,
     TokenStorageError,
 )
 
+__version__ = "0.1.0"
+
+if TYPE_CHECKING:
+    from comdirect_client.client import ComdirectClient
+
 __all__ = [
     "ComdirectClient",
     "ComdirectAPIError",
@@ -37,3 +45,18 @@ __all__ = [
     "TokenPersistence",
     "TokenStorageError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ComdirectClient on first access and cache it in the module namespace."""
+    if name != "ComdirectClient":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = importlib.import_module("comdirect_client.client").ComdirectClient
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include the lazily imported ComdirectClient in dir() output."""
+    return sorted(set(globals()) | set(__all__))
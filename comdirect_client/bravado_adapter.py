@@ -1,16 +1,28 @@
 """Custom HTTP client adapter for bravado-asyncio that injects Comdirect auth headers."""
 
-import json
 import logging
-import time
-import uuid
 from typing import Any, Callable, Optional
 
 from bravado_asyncio.http_client import AsyncioClient
-from bravado.exception import HTTPError
 
 logger = logging.getLogger(__name__)
 
+_ACCEPT_JSON = "application/json"
+
+
+def _accept_header(operation: Optional[Any]) -> str:
+    """Return the Accept header value for an operation.
+
+    Operations that only produce non-JSON content (e.g. PDF, HTML) accept all of
+    their produces types; everything else accepts JSON.
+    """
+    if operation is None or not hasattr(operation, "op_spec"):
+        return _ACCEPT_JSON
+    produces = operation.op_spec.get("produces", [])
+    if produces and not any("json" in p.lower() for p in produces):
+        return ", ".join(produces)
+    return _ACCEPT_JSON
+
 
 class ComdirectBravadoClient(AsyncioClient):
     """Custom bravado-asyncio HTTP client that injects Comdirect authentication headers.
@@ -24,8 +36,7 @@ class ComdirectBravadoClient(AsyncioClient):
     def __init__(
         self,
         get_access_token: Callable[[], Optional[str]],
-        get_session_id: Callable[[], str],
-        generate_request_id: Callable[[], str],
+        get_request_info: Callable[[], str],
         *args: Any,
         **kwargs: Any,
     ):
@@ -33,17 +44,16 @@ class ComdirectBravadoClient(AsyncioClient):
 
         Args:
             get_access_token: Callable that returns the current access token
-            get_session_id: Callable that returns the current session ID (generates if None)
-            generate_request_id: Callable that generates a request ID
+            get_request_info: Callable that returns the x-http-request-info header value
             *args: Additional arguments passed to AsyncioClient
             **kwargs: Additional keyword arguments passed to AsyncioClient
         """
         super().__init__(*args, **kwargs)
         self._get_access_token = get_access_token
-        self._get_session_id = get_session_id
-        self._generate_request_id = generate_request_id
-        # Store for response header access
-        self._last_response_headers: Optional[dict[str, str]] = None
+        self._get_request_info = get_request_info
+        # Authorization header cache - the token only changes on refresh
+        self._cached_token: Optional[str] = None
+        self._cached_auth_header: Optional[str] = None
 
     def request(
         self,
@@ -62,79 +72,39 @@ class ComdirectBravadoClient(AsyncioClient):
         Returns:
             Future that resolves to the HTTP response
         """
-        # Get or create headers dict
-        headers = request_params.get("headers", {})
-        if not isinstance(headers, dict):
-            headers = dict(headers) if headers else {}
+        # Build the headers in a single dict display: the Accept default can be
+        # overridden by headers from Bravado, the x-http-request-info header cannot.
+        # For document operations, Accept uses the operation's produces list.
+        headers = {
+            "Accept": _accept_header(operation),
+            **(request_params.get("headers") or {}),
+            "x-http-request-info": self._get_request_info(),
+        }
         request_params["headers"] = headers
 
         # Inject Authorization header
         access_token = self._get_access_token()
         if access_token:
-            headers["Authorization"] = f"Bearer {access_token}"
-
-        # Inject x-http-request-info header
-        session_id = self._get_session_id()
-        request_id = self._generate_request_id()
-        headers["x-http-request-info"] = json.dumps(
-            {
-                "clientRequestId": {
-                    "sessionId": session_id,
-                    "requestId": request_id,
-                }
-            }
-        )
+            if access_token is not self._cached_token:
+                self._cached_auth_header = f"Bearer {access_token}"
+                self._cached_token = access_token
+            headers["Authorization"] = self._cached_auth_header
 
         # Inject per-request custom headers if provided
-        # request_config can be a dict or RequestConfig object
-        if request_config:
+        # request_config can be a dict ("custom_headers") or a RequestConfig object ("headers")
+        if request_config is not None:
             if isinstance(request_config, dict):
-                # Handle dict-style request_config
-                if "custom_headers" in request_config:
-                    custom_headers = request_config["custom_headers"]
-                    if isinstance(custom_headers, dict):
-                        headers.update(custom_headers)
-            else:
-                # Handle RequestConfig object - check headers attribute
-                if hasattr(request_config, "headers") and request_config.headers:
-                    if isinstance(request_config.headers, dict):
-                        headers.update(request_config.headers)
-
-        # Ensure Accept header is set
-        # For document operations, use the operation's produces list instead of defaulting to JSON
-        if "Accept" not in headers:
-            if operation and hasattr(operation, 'op_spec'):
-                # Check if operation produces non-JSON content types
-                produces = operation.op_spec.get('produces', [])
-                if produces and not any('json' in p.lower() for p in produces):
-                    # Operation produces non-JSON content (e.g., PDF, HTML)
-                    # Accept all produces types (comma-separated)
-                    headers["Accept"] = ", ".join(produces)
-                else:
-                    headers["Accept"] = "application/json"
+                custom_headers = request_config.get("custom_headers")
             else:
-                headers["Accept"] = "application/json"
-
-        logger.debug(
-            f"Making {request_params.get('method', 'UNKNOWN')} request to "
-            f"{request_params.get('url', 'UNKNOWN')} with auth headers"
-        )
-
-        # Call parent request method
-        future = super().request(request_params, operation, request_config)
-        
-        # Wrap future to capture response headers
-        # Note: This is a simplified approach - full header capture would require
-        # wrapping the response object, which is complex with bravado-asyncio
-        return future
-
-    def get_last_response_headers(self) -> Optional[dict[str, str]]:
-        """Get headers from the last response (if available).
-        
-        Note: This is a simplified implementation. Full header access would require
-        more complex response wrapping.
-        
-        Returns:
-            Response headers dict or None
-        """
-        return self._last_response_headers
+                custom_headers = getattr(request_config, "headers", None)
+            if custom_headers and isinstance(custom_headers, dict):
+                headers.update(custom_headers)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Making %s request to %s with auth headers",
+                request_params.get("method", "UNKNOWN"),
+                request_params.get("url", "UNKNOWN"),
+            )
+
+        return super().request(request_params, operation, request_config)
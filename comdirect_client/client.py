@@ -1,45 +1,80 @@
 """Main Comdirect API client implementation with Bravado integration."""
 
 import asyncio
+import inspect
 import json
 import logging
+import secrets
 import time
-import uuid
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+from urllib.parse import quote, urlencode
 
 import httpx
-from bravado.client import SwaggerClient
-from bravado.exception import HTTPError
-from bravado.swagger_model import load_file
 
-from comdirect_client.bravado_adapter import ComdirectBravadoClient
+try:
+    # Optional faster JSON decoder for API responses (``orjson`` extra)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 from comdirect_client.exceptions import (
     AuthenticationError,
     NetworkTimeoutError,
+    ServerError,
     SessionActivationError,
     TANTimeoutError,
     TokenExpiredError,
+    ValidationError,
 )
 from comdirect_client.token_storage import TokenPersistence, TokenStorageError
 
+if TYPE_CHECKING:
+    # Bravado is slow to import, so it is only loaded once the Swagger spec is needed
+    from bravado.client import SwaggerClient
+
 logger = logging.getLogger(__name__)
 
 # Path to local Swagger spec (bundled with package)
 SWAGGER_SPEC_PATH = Path(__file__).parent / "swagger.json"
 
+# Callbacks may be plain functions or coroutine functions
+ReauthCallback = Callable[[str], Optional[Awaitable[None]]]
+TanStatusCallback = Callable[[str, dict[str, Any]], Optional[Awaitable[None]]]
+
+# Seconds between attempts to take the storage refresh lock while another process holds it
+REFRESH_LOCK_POLL_SECONDS = 0.5
+
+# Seconds on top of the request timeout before other processes treat a held refresh
+# lock as stale; covers reloading and saving the token file around the refresh request
+REFRESH_LOCK_TTL_MARGIN_SECONDS = 30
+
+# Delays (seconds) between TAN status polls; the last value repeats until timeout
+TAN_POLL_INTERVALS = (1, 1, 2, 2, 3, 3, 5)
+
+# Pulls all token fields out of an OAuth2 token response in a single C-level call
+_TOKEN_FIELDS = itemgetter("access_token", "refresh_token", "expires_in")
+
 
 def utc_now() -> datetime:
     """Get current UTC time as timezone-aware datetime."""
     return datetime.now(timezone.utc)
 
 
+def loop_time() -> float:
+    """Get the running event loop's clock, or time.monotonic() outside a loop."""
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
 def sanitize_token(token: str, prefix_length: int = 8) -> str:
     """Sanitize a token for logging by showing only the prefix."""
-    if not token or len(token) <= prefix_length:
-        return "***"
-    return f"{token[:prefix_length]}..."
+    return "***" if not token or len(token) <= prefix_length else f"{token[:prefix_length]}..."
 
 
 class ComdirectClient:
@@ -109,11 +144,14 @@ class ComdirectClient:
         password: str,
         base_url: str = "https://api.comdirect.de",
         swagger_spec_path: Optional[str] = None,
-        reauth_callback: Optional[Callable[[str], None]] = None,
-        tan_status_callback: Optional[Callable[[str, dict[str, Any]], None]] = None,
+        reauth_callback: Optional[ReauthCallback] = None,
+        tan_status_callback: Optional[TanStatusCallback] = None,
         token_refresh_threshold_seconds: int = 120,
         timeout_seconds: float = 30.0,
         token_storage_path: Optional[str] = None,
+        validate_requests: bool = False,
+        use_models: bool = True,
+        http2: bool = False,
     ):
         """Initialize the Comdirect API client.
 
@@ -133,6 +171,15 @@ class ComdirectClient:
             token_storage_path: Optional file path to persist tokens for session recovery.
                                Enables loading saved tokens on client restart.
                                Parent directory must exist.
+            validate_requests: Validate outgoing requests against the Swagger spec
+                              (default: False). Useful during development; costs a
+                              JSON schema walk per request.
+            use_models: Unmarshal responses into Bravado model objects (default: True).
+                       Set to False to get plain dicts, which is much cheaper for
+                       large list responses such as transactions.
+            http2: Use HTTP/2 for the requests sent through httpx (authentication,
+                  token refresh and call()), multiplexing them over one connection
+                  (default: False). Requires the ``http2`` extra (``h2`` package).
 
         Raises:
             TokenStorageError: If token_storage_path directory doesn't exist
@@ -141,12 +188,22 @@ class ComdirectClient:
         self.client_secret = client_secret
         self.username = username
         self._password = password  # Private to avoid accidental logging
+        # Every OAuth token request starts with the client credentials, so encode them once
+        self._oauth_client_body = urlencode(
+            {"client_id": client_id, "client_secret": client_secret}
+        )
         self.base_url = base_url.rstrip("/")
+        self._oauth_token_url = f"{self.base_url}/oauth/token"
         self.swagger_spec_path = Path(swagger_spec_path) if swagger_spec_path else SWAGGER_SPEC_PATH
         self.reauth_callback = reauth_callback
         self.tan_status_callback = tan_status_callback
         self.token_refresh_threshold = token_refresh_threshold_seconds
         self.timeout_seconds = timeout_seconds
+        # The refresh request is bounded by timeout_seconds, so a live refresh never
+        # holds the storage refresh lock long enough to be taken over as stale
+        self._refresh_lock_ttl = timeout_seconds + REFRESH_LOCK_TTL_MARGIN_SECONDS
+        self.validate_requests = validate_requests
+        self.use_models = use_models
 
         # Token persistence
         try:
@@ -157,89 +214,129 @@ class ComdirectClient:
 
         # State management
         self._session_id: Optional[str] = None
+        # x-http-request-info prefix, serialized once per session ID
+        self._request_info_session_id: Optional[str] = None
+        self._request_info_prefix = ""
         self._access_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
-        self._refresh_lock = asyncio.Lock()
+        # Event loop clock (loop_time()) value at which the token is refreshed automatically
+        self._refresh_deadline: Optional[float] = None
+        self._refresh_in_flight: Optional[asyncio.Task[bool]] = None
+        # One-shot timer that starts the next automatic refresh, and the refresh it started
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
         self._refresh_task: Optional[asyncio.Task[None]] = None
+        # Background awaits of cancelled refresh tasks, referenced until they finish
+        self._pending_cancellations: set[asyncio.Task[None]] = set()
+        # Tasks running async reauth / TAN status callbacks, referenced until they finish
+        self._callback_tasks: set[asyncio.Future[None]] = set()
+        # Set by close(); later calls (e.g. fixture cleanup after __aexit__) return early
+        self._closed = False
 
         # HTTP client for auth (not for API calls - those go through Bravado)
-        self._http_client = httpx.AsyncClient(timeout=timeout_seconds)
+        # Token requests, TAN polls and refreshes all go to the same host, so keep
+        # idle connections around long enough to reuse them across the auth flow
+        # and between refreshes instead of paying a new TLS handshake each time.
+        self._http_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=20, keepalive_expiry=300
+            ),
+        )
 
-        # Bravado client (initialized immediately, token functions may not be ready yet)
-        # Initialize Bravado client - it's okay if tokens aren't ready yet
+        # Bravado client, created lazily: authenticate() parses the Swagger spec in a
+        # thread while its first token request is in flight, otherwise the first
+        # access to `api` initializes it
         self._bravado_client: Optional[SwaggerClient] = None
-        # Initialize synchronously since we're using a local spec file
-        self._initialize_bravado_client()
+        # operationId -> (HTTP method, URL template, path parameter names), used by call()
+        self._raw_endpoints: dict[str, tuple[str, str, tuple[str, ...]]] = {}
 
         logger.info("ComdirectClient initialized")
 
         # Attempt to restore tokens from storage
         self._restore_tokens_from_storage()
 
+    @classmethod
+    async def create(cls, *args: Any, **kwargs: Any) -> "ComdirectClient":
+        """Create a client from async code without blocking the event loop.
+
+        Takes the same arguments as the constructor. The Swagger spec is parsed
+        and the Bravado client built in a worker thread, so other coroutines keep
+        running meanwhile. Preferred over calling the constructor directly when
+        an event loop is already running.
+
+        Returns:
+            ComdirectClient with its Bravado client initialized
+        """
+        client = cls(*args, **kwargs)
+        await asyncio.to_thread(client._initialize_bravado_client)
+        client._ensure_refresh_scheduled()
+        return client
+
     def _generate_request_id(self) -> str:
-        """Generate a 9-digit request ID from current timestamp."""
-        timestamp = str(int(time.time() * 1000))  # Milliseconds
+        """Generate a 9-digit request ID from current timestamp.
+
+        The ID consists of digits only, so it can be embedded in the
+        x-http-request-info header without JSON escaping.
+        """
+        timestamp = str(time.time_ns() // 1_000_000)  # Milliseconds
         request_id = timestamp[-9:]  # Last 9 digits
-        logger.debug(f"Request ID: {request_id}")
+        logger.debug("Request ID: %s", request_id)
         return request_id
 
     def _get_session_id(self) -> str:
         """Get or generate session ID."""
         if not self._session_id:
-            self._session_id = str(uuid.uuid4())
-            logger.debug(f"Generated session ID: {sanitize_token(self._session_id)}")
+            self._session_id = secrets.token_hex(16)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated session ID: %s", sanitize_token(self._session_id))
         return self._session_id
 
     def _get_request_info_header(self) -> str:
-        """Generate x-http-request-info header value."""
-        return json.dumps(
-            {
-                "clientRequestId": {
-                    "sessionId": self._get_session_id(),
-                    "requestId": self._generate_request_id(),
-                }
-            }
-        )
+        """Generate x-http-request-info header value.
 
-    def _get_access_token(self) -> Optional[str]:
-        """Get current access token (for Bravado adapter)."""
-        return self._access_token
+        Only the request ID changes between requests, so the JSON up to it is
+        serialized once per session ID and the request ID is spliced in.
+        """
+        session_id = self._get_session_id()
+        if session_id is not self._request_info_session_id:
+            self._request_info_prefix = (
+                '{"clientRequestId":{"sessionId":' + json.dumps(session_id) + ',"requestId":"'
+            )
+            self._request_info_session_id = session_id
+        return self._request_info_prefix + self._generate_request_id() + '"}}'
 
     def _create_bravado_client(
         self,
         get_access_token: Callable[[], Optional[str]],
-        also_return_response: bool = False,
-    ) -> SwaggerClient:
+    ) -> "SwaggerClient":
         """Create a Bravado client with custom token getter.
 
-        This is a stateless factory function that creates a Bravado client
-        with the specified token getter. It can be used for both the main
-        client (with stored token) and auth clients (with temporary tokens).
-
         Args:
             get_access_token: Callable that returns the access token to use
-            also_return_response: If True, enables access to HTTP response headers
 
         Returns:
             SwaggerClient instance
         """
+        from bravado.client import SwaggerClient
+        from bravado.swagger_model import load_file
+
+        from comdirect_client.bravado_adapter import ComdirectBravadoClient
+
         # Create HTTP client adapter with specified token getter
         http_client = ComdirectBravadoClient(
             get_access_token=get_access_token,
-            get_session_id=self._get_session_id,
-            generate_request_id=self._generate_request_id,
+            get_request_info=self._get_request_info_header,
         )
 
         # Load Swagger spec from local file and create client
         config = {
-            "validate_requests": True,  # Validate outgoing requests against Swagger spec
+            "validate_requests": self.validate_requests,  # Opt-in: validation is CPU-heavy
             "validate_responses": False,  # Disabled: API responses don't always match spec (e.g., optional fields can be null, currency as string vs object)
             "validate_swagger_spec": False,  # Disabled: trust the Swagger spec (contains custom OAuth flow)
-            "use_models": True,  # Use models for responses
+            "use_models": self.use_models,  # False returns plain dicts
         }
-        if also_return_response:
-            config["also_return_response"] = True
         spec_dict = load_file(str(self.swagger_spec_path))
         return SwaggerClient.from_spec(
             spec_dict,
@@ -247,25 +344,37 @@ class ComdirectClient:
             config=config,
         )
 
-    def _create_auth_bravado_client(
-        self, access_token: str, also_return_response: bool = False
-    ) -> SwaggerClient:
-        """Create a temporary Bravado client for authentication flow.
+    def _oauth_token_body(self, grant_type: str, **fields: Any) -> bytes:
+        """Build the URL-encoded body of an OAuth token request.
 
-        This client is only used during the authentication process and uses
-        the temporary token from the auth flow, not the stored access token.
+        Args:
+            grant_type: OAuth2 grant type
+            **fields: Grant-specific form fields
+
+        Returns:
+            Encoded body, appended to the pre-encoded client credentials
+        """
+        grant_body = urlencode({"grant_type": grant_type, **fields})
+        return f"{self._oauth_client_body}&{grant_body}".encode()
+
+    @staticmethod
+    def _auth_request_options(
+        access_token: str, headers: Optional[dict[str, str]] = None
+    ) -> dict[str, Any]:
+        """Build Bravado request options for the authentication flow.
+
+        The authentication steps reuse the main Bravado client, so the temporary
+        token from step 1 is passed as a per-request Authorization header, which
+        takes precedence over the stored access token.
 
         Args:
             access_token: Temporary access token from authentication step 1
-            also_return_response: If True, enables access to HTTP response headers
+            headers: Additional per-request headers
 
         Returns:
-            SwaggerClient instance configured for authentication
+            Dict to pass as ``_request_options`` to a Bravado operation
         """
-        return self._create_bravado_client(
-            get_access_token=lambda: access_token,
-            also_return_response=also_return_response,
-        )
+        return {"headers": {"Authorization": f"Bearer {access_token}", **(headers or {})}}
 
     def _initialize_bravado_client(self) -> None:
         """Initialize the main Bravado client with the Swagger spec."""
@@ -275,14 +384,118 @@ class ComdirectClient:
         logger.info("Initializing Bravado client from Swagger spec")
 
         try:
-            self._bravado_client = self._create_bravado_client(self._get_access_token)
+            # attrgetter + partial read the current token without a Python-level call frame
+            self._bravado_client = self._create_bravado_client(
+                partial(attrgetter("_access_token"), self)
+            )
+            self._raw_endpoints = self._build_raw_endpoints(self._bravado_client)
             logger.info("Bravado client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Bravado client: {e}")
             raise
 
+    def _build_raw_endpoints(
+        self, swagger_client: "SwaggerClient"
+    ) -> dict[str, tuple[str, str, tuple[str, ...]]]:
+        """Precompile the URL template of every Swagger operation for call().
+
+        Args:
+            swagger_client: Bravado client holding the parsed Swagger spec
+
+        Returns:
+            Dict mapping operationId to (HTTP method, URL template, path parameter names)
+        """
+        spec = swagger_client.swagger_spec
+        base_path = spec.spec_dict.get("basePath", "")
+        endpoints = {}
+        for resource in spec.resources.values():
+            for operation_id, operation in resource.operations.items():
+                path_params = tuple(
+                    param.name for param in operation.params.values() if param.location == "path"
+                )
+                endpoints[operation_id] = (
+                    operation.http_method.upper(),
+                    f"{self.base_url}{base_path}{operation.path_name}",
+                    path_params,
+                )
+        return endpoints
+
+    async def call(
+        self,
+        operation_id: str,
+        params: Optional[dict[str, Any]] = None,
+        body: Optional[Any] = None,
+    ) -> Any:
+        """Call an API operation directly via httpx, bypassing Bravado.
+
+        Intended for hot paths such as balance or transaction polling: no request
+        validation or model construction takes place and the decoded JSON is returned.
+
+        Args:
+            operation_id: Swagger operationId (e.g. "bankingV1GetAccountTransactions")
+            params: Path and query parameters, keyed by their names in the spec
+            body: JSON request body, if the operation takes one
+
+        Returns:
+            Decoded JSON response body, or None for empty responses
+
+        Raises:
+            RuntimeError: If client is not authenticated
+            KeyError: If the operationId is not in the Swagger spec
+            NetworkTimeoutError: If the request times out
+            TokenExpiredError: If the API rejects the access token (401)
+            ValidationError: If the API rejects the request parameters (422)
+            ServerError: If the API returns a server error (5xx)
+            httpx.HTTPStatusError: If the API returns any other error status
+        """
+        if not self.is_authenticated():
+            raise RuntimeError(
+                "Client not authenticated. Call authenticate() first before accessing API."
+            )
+        self._ensure_refresh_scheduled()
+        if not self._raw_endpoints:
+            # Fills _raw_endpoints along with the Bravado client
+            self._initialize_bravado_client()
+
+        method, url_template, path_params = self._raw_endpoints[operation_id]
+        query = dict(params) if params else {}
+        url = url_template
+        for name in path_params:
+            url = url.replace("{" + name + "}", quote(str(query.pop(name)), safe=""))
+
+        try:
+            response = await self._http_client.request(
+                method,
+                url,
+                params=query or None,
+                json=body,
+                headers={
+                    "Accept": "application/json",
+                    "Authorization": f"Bearer {self._access_token}",
+                    "x-http-request-info": self._get_request_info_header(),
+                },
+            )
+        except httpx.TimeoutException as e:
+            logger.error("Network timeout calling %s", operation_id)
+            raise NetworkTimeoutError(f"{operation_id} request timed out") from e
+
+        status = response.status_code
+        if status == 401:
+            logger.error(f"{operation_id} rejected the access token (401)")
+            raise TokenExpiredError(f"{operation_id} returned 401 Unauthorized")
+        if status == 422:
+            logger.error(f"{operation_id} rejected the request parameters (422)")
+            raise ValidationError(f"{operation_id} validation failed: {response.text}")
+        if status >= 500:
+            logger.error(f"{operation_id} failed with server error {status}")
+            raise ServerError(f"{operation_id} failed with server error {status}")
+        response.raise_for_status()
+        if not response.content:
+            return None
+        return json_loads(response.content)
+
     @property
-    def api(self) -> SwaggerClient:
+    def api(self) -> "SwaggerClient":
         """Access the Bravado-generated API client.
 
         Returns:
@@ -295,9 +508,16 @@ class ComdirectClient:
             raise RuntimeError(
                 "Client not authenticated. Call authenticate() first before accessing API."
             )
+        self._ensure_refresh_scheduled()
+        return self._swagger_client
+
+    @property
+    def _swagger_client(self) -> "SwaggerClient":
+        """Main Bravado client, without the authentication check of `api`."""
         if self._bravado_client is None:
-            # Initialize synchronously (should have been done in __init__, but handle edge case)
+            # Initialize synchronously on first use outside of authenticate()
             self._initialize_bravado_client()
+        assert self._bravado_client is not None
         return self._bravado_client
 
     async def authenticate(self) -> None:
@@ -310,7 +530,7 @@ class ComdirectClient:
         4. Polls for TAN approval (60 second timeout)
         5. Activates session
         6. Exchanges for secondary token with banking scope
-        7. Starts automatic token refresh task
+        7. Schedules automatic token refresh
         8. Initializes Bravado client
 
         Raises:
@@ -323,7 +543,14 @@ class ComdirectClient:
 
         try:
             # Step 1: OAuth2 Password Credentials
-            initial_token = await self._step1_password_credentials()
+            if self._bravado_client is None:
+                # Parse the Swagger spec in a thread while the token request is in flight
+                initial_token, _ = await asyncio.gather(
+                    self._step1_password_credentials(),
+                    asyncio.to_thread(self._initialize_bravado_client),
+                )
+            else:
+                initial_token = await self._step1_password_credentials()
 
             # Step 2: Get Session UUID
             session_uuid = await self._step2_session_status(initial_token)
@@ -344,9 +571,6 @@ class ComdirectClient:
 
             logger.info("Authentication successful")
 
-            # Start automatic token refresh task
-            self._start_refresh_task()
-
         except Exception as e:
             logger.error(f"Authentication failed: {e}")
             self._clear_tokens()
@@ -365,18 +589,14 @@ class ComdirectClient:
 
         try:
             response = await self._http_client.post(
-                f"{self.base_url}/oauth/token",
+                self._oauth_token_url,
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "grant_type": "password",
-                    "username": self.username,
-                    "password": self._password,
-                },
+                content=self._oauth_token_body(
+                    "password", username=self.username, password=self._password
+                ),
             )
 
             if response.status_code == 401:
@@ -386,9 +606,9 @@ class ComdirectClient:
             response.raise_for_status()
             data = response.json()
 
-            access_token = data["access_token"]
-            logger.info(f"OAuth2 token obtained: {sanitize_token(access_token)}")
-            return cast(str, access_token)
+            access_token: str = data["access_token"]
+            logger.info("OAuth2 token obtained: %s", sanitize_token(access_token))
+            return access_token
 
         except httpx.TimeoutException as e:
             logger.error("Network timeout during authentication")
@@ -411,22 +631,24 @@ class ComdirectClient:
         """
         logger.debug("Step 2: Retrieving session status")
 
-        try:
-            # Create temporary Bravado client for authentication flow
-            auth_client = self._create_auth_bravado_client(access_token)
+        from bravado.exception import HTTPError
 
-            # Use Bravado-generated method
+        try:
+            # Use Bravado-generated method with the temporary token from step 1
             # Resources are organized by tags (capitalized), operations are accessed via operationId
             # With bravado-asyncio in THREAD mode, HttpFuture.result() is synchronous and returns the unmarshalled result
-            http_future = auth_client.Session.sessionV1GetSession(user="user")
+            http_future = self._swagger_client.Session.sessionV1GetSession(
+                user="user", _request_options=self._auth_request_options(access_token)
+            )
             sessions = http_future.result()
 
             if not sessions or len(sessions) == 0:
                 raise AuthenticationError("No session data returned")
 
-            session_uuid = sessions[0].identifier
-            logger.info(f"Session UUID retrieved: {sanitize_token(session_uuid)}")
-            return cast(str, session_uuid)
+            # Item access works for both Bravado models and plain dicts (use_models=False)
+            session_uuid: str = sessions[0]["identifier"]
+            logger.info("Session UUID retrieved: %s", sanitize_token(session_uuid))
+            return session_uuid
 
         except HTTPError as e:
             if e.status_code == 401:
@@ -455,19 +677,15 @@ class ComdirectClient:
         """
         logger.debug("Step 3: Creating TAN challenge")
 
-        try:
-            # Create temporary Bravado client for authentication flow with response access
-            auth_client = self._create_auth_bravado_client(
-                access_token, also_return_response=True
-            )
+        from bravado.exception import HTTPError
 
-            # Use Bravado-generated method
-            # We need also_return_response=True to access response headers
+        try:
+            # Use Bravado-generated method with the temporary token from step 1
             # Operation ID: sessionV1PostSessionValidation
             # Resources are organized by tags (capitalized), operations are accessed via operationId
             # The API returns 201, which may not be in the Swagger spec, so we access the raw response
             # via future.result() to get AsyncioResponse, then access headers from the aiohttp response
-            http_future = auth_client.Session.sessionV1PostSessionValidation(
+            http_future = self._swagger_client.Session.sessionV1PostSessionValidation(
                 user="user",
                 session=session_uuid,
                 body={
@@ -475,6 +693,7 @@ class ComdirectClient:
                     "sessionTanActive": True,
                     "activated2FA": True,
                 },
+                _request_options=self._auth_request_options(access_token),
             )
             # Access raw response via future.result() to bypass Swagger validation
             # This gives us the AsyncioResponse with the aiohttp response
@@ -490,8 +709,8 @@ class ComdirectClient:
             tan_type = auth_info["typ"]
             poll_url = auth_info["link"]["href"]
 
-            logger.info(f"TAN challenge created - Type: {tan_type}, ID: {challenge_id}")
-            logger.warning(f"TAN approval required - Method: {tan_type}, Timeout: 60 seconds")
+            logger.info("TAN challenge created - Type: %s, ID: %s", tan_type, challenge_id)
+            logger.warning("TAN approval required - Method: %s, Timeout: 60 seconds", tan_type)
 
             # Notify that TAN has been requested
             self._invoke_tan_status_callback(
@@ -521,46 +740,54 @@ class ComdirectClient:
         Raises:
             TANTimeoutError: If TAN approval times out after 60 seconds
         """
-        logger.info(f"Step 4: Waiting for TAN approval ({tan_type})")
+        logger.info("Step 4: Waiting for TAN approval (%s)", tan_type)
 
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = 60  # 60 seconds timeout
-        poll_interval = 1  # 1 second between polls
+        poll_count = 0
+        next_progress_update = 10  # Report pending status roughly every 10 seconds
 
         # Notify that TAN approval is pending
         self._invoke_tan_status_callback(
             "pending", {"tan_type": tan_type, "timeout_seconds": timeout, "elapsed_seconds": 0}
         )
 
-        while time.time() - start_time < timeout:
-            await asyncio.sleep(poll_interval)
-            elapsed = int(time.time() - start_time)
+        # Only the request info changes between polls, so build the rest once
+        tan_poll_url = f"{self.base_url}{poll_url}"
+        poll_headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json",
+        }
+
+        while time.monotonic() - start_time < timeout:
+            # Back off between polls - most approvals take a few seconds, so later
+            # polls are spaced out to save round trips
+            poll_interval = TAN_POLL_INTERVALS[min(poll_count, len(TAN_POLL_INTERVALS) - 1)]
+            poll_count += 1
+            time_left = timeout - (time.monotonic() - start_time)
+            await asyncio.sleep(min(poll_interval, time_left))
+            elapsed = int(time.monotonic() - start_time)
             remaining = timeout - elapsed
-            logger.debug(f"Polling TAN status (elapsed: {elapsed}s, remaining: {remaining}s)")
+            logger.debug("Polling TAN status (elapsed: %ds, remaining: %ds)", elapsed, remaining)
+
+            poll_headers["x-http-request-info"] = self._get_request_info_header()
 
             try:
-                response = await self._http_client.get(
-                    f"{self.base_url}{poll_url}",
-                    headers={
-                        "Authorization": f"Bearer {access_token}",
-                        "Accept": "application/json",
-                        "x-http-request-info": self._get_request_info_header(),
-                    },
-                )
+                response = await self._http_client.get(tan_poll_url, headers=poll_headers)
 
                 if response.status_code == 200:
-                    data = response.json()
-                    status = data.get("status")
+                    status = json_loads(response.content).get("status")
 
                     if status == "AUTHENTICATED":
-                        logger.info(f"TAN approved via {tan_type}")
+                        logger.info("TAN approved via %s", tan_type)
                         self._invoke_tan_status_callback(
                             "approved", {"tan_type": tan_type, "elapsed_seconds": elapsed}
                         )
                         return
                     elif status == "PENDING":
-                        if elapsed % 10 == 0 and elapsed > 0:  # Log every 10 seconds
-                            logger.info(f"Still waiting for TAN approval ({elapsed}s elapsed)")
+                        if elapsed >= next_progress_update:
+                            next_progress_update = elapsed - elapsed % 10 + 10
+                            logger.info("Still waiting for TAN approval (%ds elapsed)", elapsed)
                             self._invoke_tan_status_callback(
                                 "pending",
                                 {
@@ -573,10 +800,10 @@ class ComdirectClient:
                         logger.debug("TAN approval pending, continuing poll")
                         continue
                     else:
-                        logger.error(f"Unexpected TAN status: {status}")
+                        logger.error("Unexpected TAN status: %s", status)
                         raise AuthenticationError(f"Unexpected TAN status: {status}")
                 else:
-                    logger.warning(f"Poll returned status {response.status_code}, retrying")
+                    logger.warning("Poll returned status %d, retrying", response.status_code)
 
             except httpx.TimeoutException:
                 logger.warning("Poll request timed out, retrying")
@@ -604,16 +831,15 @@ class ComdirectClient:
         """
         logger.debug("Step 4b: Activating session")
 
-        try:
-            # Create temporary Bravado client for authentication flow
-            auth_client = self._create_auth_bravado_client(access_token)
+        from bravado.exception import HTTPError
 
-            # Use Bravado-generated method with custom header via _request_options
+        try:
+            # Use Bravado-generated method with custom headers via _request_options
             # See: https://bravado.readthedocs.io/en/latest/advanced.html#adding-request-headers
             # Operation ID: sessionV1PatchSession
             # Resources are organized by tags (capitalized), operations are accessed via operationId
             # With bravado-asyncio in THREAD mode, HttpFuture.result() is synchronous and returns the unmarshalled result
-            http_future = auth_client.Session.sessionV1PatchSession(
+            http_future = self._swagger_client.Session.sessionV1PatchSession(
                 user="user",
                 session=session_uuid,
                 body={
@@ -621,11 +847,10 @@ class ComdirectClient:
                     "sessionTanActive": True,
                     "activated2FA": True,
                 },
-                _request_options={
-                    "headers": {
-                        "x-once-authentication-info": json.dumps({"id": challenge_id}),
-                    }
-                },
+                _request_options=self._auth_request_options(
+                    access_token,
+                    {"x-once-authentication-info": json.dumps({"id": challenge_id})},
+                ),
             )
             http_future.result()  # Synchronous call - no await needed
 
@@ -654,35 +879,27 @@ class ComdirectClient:
 
         try:
             response = await self._http_client.post(
-                f"{self.base_url}/oauth/token",
+                self._oauth_token_url,
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "grant_type": "cd_secondary",
-                    "token": initial_token,
-                },
+                content=self._oauth_token_body("cd_secondary", token=initial_token),
             )
 
             response.raise_for_status()
-            data = response.json()
+            self._access_token, self._refresh_token, expires_in = _TOKEN_FIELDS(response.json())
 
-            self._access_token = data["access_token"]
-            self._refresh_token = data["refresh_token"]
-            expires_in = data["expires_in"]
-
-            self._token_expiry = utc_now() + timedelta(seconds=expires_in)
+            self._set_token_lifetime(expires_in)
 
             logger.info(
-                f"Secondary token obtained: {sanitize_token(self._access_token or '')}, "
-                f"expires in {expires_in}s"
+                "Secondary token obtained: %s, expires in %ss",
+                sanitize_token(self._access_token or ""),
+                expires_in,
             )
 
             # Save tokens to persistent storage
-            self._save_tokens_to_storage()
+            await self._save_tokens_to_storage_async()
 
         except httpx.TimeoutException as e:
             logger.error("Network timeout during token exchange")
@@ -694,6 +911,9 @@ class ComdirectClient:
     async def refresh_token(self) -> bool:
         """Refresh the access token using the refresh token.
 
+        Concurrent calls share a single in-flight refresh, so only one token
+        request is sent no matter how many coroutines ask for a refresh at once.
+
         Returns:
             True if refresh succeeded, False otherwise
 
@@ -704,101 +924,239 @@ class ComdirectClient:
             logger.error("No refresh token available")
             return False
 
-        async with self._refresh_lock:
-            logger.debug("Acquiring token refresh lock")
-            logger.info("Refreshing token")
+        self._ensure_refresh_scheduled()
+        if self._refresh_in_flight is None:
+            self._refresh_in_flight = asyncio.create_task(self._refresh_token_request())
+            self._refresh_in_flight.add_done_callback(self._clear_refresh_in_flight)
+        else:
+            logger.debug("Token refresh already in progress, waiting for result")
+
+        # Shielded so that a cancelled caller does not abort the refresh other callers wait on
+        return await asyncio.shield(self._refresh_in_flight)
 
-            try:
-                response = await self._http_client.post(
-                    f"{self.base_url}/oauth/token",
+    def _clear_refresh_in_flight(self, task: "asyncio.Task[bool]") -> None:
+        """Forget the in-flight refresh once it has finished."""
+        if self._refresh_in_flight is task:
+            self._refresh_in_flight = None
+
+    async def _refresh_token_request(self) -> bool:
+        """Refresh the tokens, coordinating with other processes sharing token storage.
+
+        If another process holds the storage refresh lock, this waits until the
+        lock is released or goes stale (see TokenPersistence.acquire_refresh_lock).
+        Once the lock is held, storage is reloaded first: if another process has
+        refreshed in the meantime, its tokens are adopted instead of spending the
+        in-memory refresh token, which the server has already invalidated.
+
+        Returns:
+            True if refresh succeeded, False otherwise
+        """
+        # refresh_token() runs at most one of these at a time, so only the
+        # storage lock shared with other processes is needed here
+        logger.debug("Acquiring token refresh lock")
+        if not await self._acquire_storage_refresh_lock():
+            logger.info("Token refresh in progress in another process, waiting for it")
+            while not await self._acquire_storage_refresh_lock():
+                await asyncio.sleep(REFRESH_LOCK_POLL_SECONDS)
+
+        try:
+            if await self._reload_tokens_from_storage():
+                return True
+            return await self._send_refresh_request()
+        finally:
+            await self._release_storage_refresh_lock()
+            logger.debug("Token refresh lock released")
+
+    async def _acquire_storage_refresh_lock(self) -> bool:
+        """Try to take the storage refresh lock without blocking the event loop.
+
+        The worker thread cannot be interrupted, so if the caller is cancelled
+        (e.g. by close()) it may still create the lock file. In that case the
+        thread is waited for and a lock it acquired is released again, instead
+        of blocking other processes until the lock goes stale.
+
+        Returns:
+            True if the lock was acquired (or no persistence is configured)
+        """
+        if self._token_storage.storage_path is None:
+            return True
+        acquire = asyncio.ensure_future(
+            asyncio.to_thread(self._token_storage.acquire_refresh_lock, self._refresh_lock_ttl)
+        )
+        try:
+            return await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            if await acquire:
+                await self._release_storage_refresh_lock()
+            raise
+
+    async def _release_storage_refresh_lock(self) -> None:
+        """Release the storage refresh lock without blocking the event loop.
+
+        Shielded so that a cancelled refresh still releases the lock instead of
+        leaving it to go stale.
+        """
+        if self._token_storage.storage_path is None:
+            return
+        await asyncio.shield(asyncio.to_thread(self._token_storage.release_refresh_lock))
+
+    async def _send_refresh_request(self) -> bool:
+        """Send the refresh token request and store the new tokens.
+
+        Returns:
+            True if refresh succeeded, False otherwise
+        """
+        logger.info("Refreshing token")
+
+        try:
+            # httpx applies its timeout per connect/read/write step; bound the whole
+            # request so the storage refresh lock is released within its TTL
+            response = await asyncio.wait_for(
+                self._http_client.post(
+                    self._oauth_token_url,
                     headers={
                         "Accept": "application/json",
                         "Content-Type": "application/x-www-form-urlencoded",
                     },
-                    data={
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "grant_type": "refresh_token",
-                        "refresh_token": self._refresh_token,
-                    },
-                )
+                    content=self._oauth_token_body(
+                        "refresh_token", refresh_token=self._refresh_token
+                    ),
+                ),
+                self.timeout_seconds,
+            )
 
-                if response.status_code == 401:
-                    logger.warning("Token refresh failed - token expired")
-                    self._invoke_reauth_callback("token_refresh_failed")
-                    return False
+            if response.status_code == 401:
+                logger.warning("Token refresh failed - token expired")
+                self._invoke_reauth_callback("token_refresh_failed")
+                return False
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            self._access_token, self._refresh_token, expires_in = _TOKEN_FIELDS(response.json())
 
-                self._access_token = data["access_token"]
-                self._refresh_token = data["refresh_token"]
-                expires_in = data["expires_in"]
+            self._set_token_lifetime(expires_in)
 
-                self._token_expiry = utc_now() + timedelta(seconds=expires_in)
+            logger.info("Token refreshed, expires in %ss", expires_in)
 
-                logger.info(f"Token refreshed, expires in {expires_in}s")
-                logger.debug("Token refresh lock released")
+            # Save tokens to persistent storage
+            await self._save_tokens_to_storage_async()
 
-                # Save tokens to persistent storage
-                self._save_tokens_to_storage()
+            return True
 
-                return True
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            logger.error("Network timeout during token refresh")
+            return False
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error during token refresh: {e.response.status_code}")
+            return False
 
-            except httpx.TimeoutException:
-                logger.error("Network timeout during token refresh")
-                return False
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error during token refresh: {e.response.status_code}")
-                return False
+    def _schedule_refresh(self) -> None:
+        """Arm a one-shot timer that refreshes the token shortly before it expires.
 
-    def _start_refresh_task(self) -> None:
-        """Start the background token refresh task."""
-        if self._refresh_task and not self._refresh_task.done():
-            self._refresh_task.cancel()
+        Replaces any previously scheduled refresh. Without a running event loop
+        (e.g. tokens restored in a synchronous constructor call) or once the
+        client is closed, nothing is scheduled; see _ensure_refresh_scheduled.
+        """
+        self._cancel_scheduled_refresh()
+        if self._refresh_deadline is None or self._closed:
+            return
 
-        self._refresh_task = asyncio.create_task(self._token_refresh_loop())
-        logger.info("Token refresh task started")
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop, automatic token refresh scheduled on first use")
+            return
 
-    async def _token_refresh_loop(self) -> None:
-        """Background task that automatically refreshes tokens before expiration."""
-        while True:
-            try:
-                if not self._token_expiry:
-                    await asyncio.sleep(10)
-                    continue
-
-                # Calculate time until refresh needed
-                now = utc_now()
-                refresh_time = self._token_expiry - timedelta(seconds=self.token_refresh_threshold)
-                sleep_duration = (refresh_time - now).total_seconds()
-
-                if sleep_duration > 0:
-                    logger.debug(f"Next token refresh in {sleep_duration:.0f}s")
-                    await asyncio.sleep(sleep_duration)
-                else:
-                    # Token is already expired or near expiry, refresh immediately
-                    logger.info(
-                        f"Token already expired or near expiry (by {-sleep_duration:.0f}s), refreshing immediately"
-                    )
-
-                # Refresh token
-                logger.info(
-                    f"Auto-refreshing token ({self.token_refresh_threshold}s before expiry)"
-                )
-                success = await self.refresh_token()
+        self._refresh_handle = loop.call_at(self._refresh_deadline, self._start_scheduled_refresh)
+        logger.info(
+            "Token refresh scheduled (in %.0fs)", max(0.0, self._refresh_deadline - loop.time())
+        )
 
-                if not success:
-                    logger.error("Automatic token refresh failed")
-                    self._invoke_reauth_callback("automatic_refresh_failed")
-                    break
+    def _ensure_refresh_scheduled(self) -> None:
+        """Arm the automatic refresh timer if it could not be armed earlier.
 
-            except asyncio.CancelledError:
-                logger.info("Token refresh task cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in token refresh loop: {e}")
-                await asyncio.sleep(10)
+        Called from the async entry points, so tokens restored by a constructor
+        call outside of an event loop still get refreshed automatically.
+        """
+        if (
+            self._refresh_handle is None
+            and self._refresh_deadline is not None
+            and (self._refresh_task is None or self._refresh_task.done())
+        ):
+            self._schedule_refresh()
+
+    def _cancel_scheduled_refresh(self) -> None:
+        """Disarm the automatic refresh timer, if any."""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
+    def _start_scheduled_refresh(self) -> None:
+        """Timer callback that runs the automatic refresh in a task.
+
+        If a previous automatic refresh is still running, the timer is re-armed
+        once it finishes instead, so two refreshes never run concurrently and
+        the firing is not lost.
+        """
+        self._refresh_handle = None
+        if self._refresh_task is not None and not self._refresh_task.done():
+            logger.debug("Automatic token refresh already running, rescheduling after it")
+            self._refresh_task.add_done_callback(self._reschedule_after_refresh)
+            return
+        self._refresh_task = asyncio.create_task(self._scheduled_refresh())
+
+    def _reschedule_after_refresh(self, task: "asyncio.Task[None]") -> None:
+        """Re-arm the timer for a firing that arrived while a refresh was running."""
+        if self._refresh_handle is None:
+            self._schedule_refresh()
+
+    async def _cancel_refresh_task(self) -> None:
+        """Cancel the background refresh task and wait for it to finish.
+
+        A cancelled task keeps its coroutine frame alive until it is awaited.
+        """
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done() or task is asyncio.current_task():
+            return
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def _cancel_refresh_task_soon(self) -> None:
+        """Cancel the background refresh task from synchronous code.
+
+        The task is cancelled immediately and awaited in the background.
+        """
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        if task is asyncio.current_task():
+            return
+        cleanup = asyncio.get_running_loop().create_task(self._await_cancelled(task))
+        self._pending_cancellations.add(cleanup)
+        cleanup.add_done_callback(self._pending_cancellations.discard)
+
+    @staticmethod
+    async def _await_cancelled(task: "asyncio.Task[Any]") -> None:
+        """Wait for a cancelled task so it can be freed."""
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def _scheduled_refresh(self) -> None:
+        """Refresh the token before it expires.
+
+        A successful refresh stores the new expiry, which arms the next timer.
+        """
+        logger.info("Auto-refreshing token (%ss before expiry)", self.token_refresh_threshold)
+        try:
+            success = await self.refresh_token()
+        except Exception as e:
+            logger.error(f"Error in automatic token refresh: {e}")
+            loop = asyncio.get_running_loop()
+            self._refresh_handle = loop.call_later(10, self._start_scheduled_refresh)
+            return
+
+        if not success:
+            logger.error("Automatic token refresh failed")
+            self._invoke_reauth_callback("automatic_refresh_failed")
 
     def _invoke_reauth_callback(self, reason: str) -> None:
         """Invoke the reauth callback if registered.
@@ -809,13 +1167,13 @@ class ComdirectClient:
         self._clear_tokens()
 
         logger.warning(
-            f"Reauthentication required - Reason: {reason}, Action: Call authenticate() again"
+            "Reauthentication required - Reason: %s, Action: Call authenticate() again", reason
         )
 
         if self.reauth_callback:
-            logger.info(f"Invoking reauth callback - Reason: {reason}")
+            logger.info("Invoking reauth callback - Reason: %s", reason)
             try:
-                self.reauth_callback(reason)
+                self._track_callback_result(self.reauth_callback(reason), "reauth")
             except Exception as e:
                 logger.error(f"Error in reauth callback: {e}")
         else:
@@ -826,47 +1184,128 @@ class ComdirectClient:
         self._access_token = None
         self._refresh_token = None
         self._token_expiry = None
+        self._refresh_deadline = None
 
-        if self._refresh_task and not self._refresh_task.done():
-            self._refresh_task.cancel()
+        self._cancel_scheduled_refresh()
+        self._cancel_refresh_task_soon()
 
         logger.debug("Tokens cleared")
 
+    def _set_token_expiry(self, token_expiry: datetime) -> None:
+        """Store the token expiry and derive the refresh deadline on the loop clock.
+
+        Args:
+            token_expiry: Access token expiration datetime (UTC)
+        """
+        self._token_expiry = token_expiry
+        self._set_refresh_deadline(token_expiry.timestamp() - time.time())
+
+    def _set_token_lifetime(self, expires_in: float) -> None:
+        """Store the expiry of a token that is valid for ``expires_in`` seconds from now.
+
+        The refresh deadline is derived from the lifetime directly; the expiry
+        datetime is only kept for persistence and get_token_expiry().
+
+        Args:
+            expires_in: Token lifetime in seconds, as returned by the token endpoint
+        """
+        self._token_expiry = utc_now() + timedelta(seconds=expires_in)
+        self._set_refresh_deadline(expires_in)
+
+    def _set_refresh_deadline(self, seconds_left: float) -> None:
+        """Schedule the automatic refresh for a token valid for ``seconds_left`` more seconds.
+
+        The refresh runs ``token_refresh_threshold`` seconds before expiry, but
+        never before half of the remaining lifetime has passed. Otherwise a token
+        whose lifetime is shorter than the threshold would be refreshed again
+        immediately after every refresh.
+
+        Args:
+            seconds_left: Remaining token lifetime in seconds (negative if expired)
+        """
+        delay = max(seconds_left - self.token_refresh_threshold, seconds_left / 2)
+        self._refresh_deadline = loop_time() + delay
+        self._schedule_refresh()
+
     def _restore_tokens_from_storage(self) -> None:
         """Restore tokens from persistent storage if available.
 
         If token storage is configured and valid tokens exist in storage,
-        loads them into memory and starts the refresh task.
+        loads them into memory and schedules the automatic refresh.
         """
+        if self._token_storage.storage_path is None:
+            return
+
         try:
             tokens = self._token_storage.load_tokens()
             if tokens:
                 access_token, refresh_token, token_expiry = tokens
                 self._access_token = access_token
                 self._refresh_token = refresh_token
-                self._token_expiry = token_expiry
-                logger.info(f"Tokens restored from storage (expires: {token_expiry.isoformat()})")
-                self._start_refresh_task()
-                # Bravado client initialization is already handled in __init__
+                self._set_token_expiry(token_expiry)
+                logger.info("Tokens restored from storage (expires: %s)", token_expiry.isoformat())
         except TokenStorageError as e:
-            logger.warning(f"Failed to restore tokens from storage: {e}")
+            logger.warning("Failed to restore tokens from storage: %s", e)
+
+    async def _reload_tokens_from_storage(self) -> bool:
+        """Adopt tokens another process has refreshed and written to storage.
+
+        The file is read in a worker thread so the event loop is not blocked.
+
+        Only tokens that expire strictly later than the in-memory ones are
+        adopted. A save that failed earlier leaves an older pair in storage,
+        whose refresh token the server has already invalidated.
+
+        Returns:
+            True if storage held newer tokens, False otherwise
+        """
+        if self._token_storage.storage_path is None:
+            return False
+
+        try:
+            tokens = await asyncio.to_thread(self._token_storage.load_tokens)
+        except TokenStorageError as e:
+            logger.warning("Failed to reload tokens from storage: %s", e)
+            return False
+
+        if (
+            not tokens
+            or tokens[1] == self._refresh_token
+            or (self._token_expiry is not None and tokens[2] <= self._token_expiry)
+        ):
+            logger.debug("No newer tokens in storage")
+            return False
+
+        self._access_token, self._refresh_token, token_expiry = tokens
+        self._set_token_expiry(token_expiry)
+        logger.info("Adopted tokens refreshed by another process")
+        return True
+
+    async def _save_tokens_to_storage_async(self) -> None:
+        """Save current tokens to persistent storage without blocking the event loop."""
+        if self._token_storage.storage_path is None:
+            return  # Don't spin up a worker thread for a no-op
 
-    def _save_tokens_to_storage(self) -> None:
-        """Save current tokens to persistent storage if configured."""
         if self._access_token and self._refresh_token and self._token_expiry:
             try:
-                self._token_storage.save_tokens(
-                    self._access_token, self._refresh_token, self._token_expiry
+                await asyncio.to_thread(
+                    self._token_storage.save_tokens,
+                    self._access_token,
+                    self._refresh_token,
+                    self._token_expiry,
                 )
             except TokenStorageError as e:
-                logger.warning(f"Failed to save tokens to storage: {e}")
+                logger.warning("Failed to save tokens to storage: %s", e)
 
     def _clear_token_storage(self) -> None:
         """Clear token storage (useful for logout)."""
+        if self._token_storage.storage_path is None:
+            return
+
         try:
             self._token_storage.clear_tokens()
         except Exception as e:
-            logger.warning(f"Failed to clear token storage: {e}")
+            logger.warning("Failed to clear token storage: %s", e)
 
     def is_authenticated(self) -> bool:
         """Check if the client is currently authenticated.
@@ -875,11 +1314,13 @@ class ComdirectClient:
             True if authenticated with valid token, False otherwise
         """
         result = self._access_token is not None and self._token_expiry is not None
-        logger.debug(
-            f"is_authenticated() check: access_token={'present' if self._access_token else 'None'}, "
-            f"token_expiry={'present' if self._token_expiry else 'None'}, "
-            f"result={result}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "is_authenticated() check: access_token=%s, token_expiry=%s, result=%s",
+                "present" if self._access_token else "None",
+                "present" if self._token_expiry else "None",
+                result,
+            )
         return result
 
     def get_token_expiry(self) -> Optional[datetime]:
@@ -890,23 +1331,23 @@ class ComdirectClient:
         """
         return self._token_expiry
 
-    def register_reauth_callback(self, callback: Callable[[str], None]) -> None:
+    def register_reauth_callback(self, callback: ReauthCallback) -> None:
         """Register a callback to be invoked when reauth is required.
 
         Args:
-            callback: Function to call with error message when reauth is needed
+            callback: Function to call with error message when reauth is needed.
+                     Coroutine functions are run as background tasks.
         """
         self.reauth_callback = callback
 
-    def register_tan_status_callback(
-        self, callback: Callable[[str, dict[str, Any]], None]
-    ) -> None:
+    def register_tan_status_callback(self, callback: TanStatusCallback) -> None:
         """Register a callback to be invoked during TAN approval process.
 
         Args:
             callback: Function to call with (status, data) during TAN approval.
                      Status values: 'requested', 'pending', 'approved', 'timeout'
                      Data dict contains additional info like tan_type, elapsed_seconds, etc.
+                     Coroutine functions are run as background tasks.
         """
         self.tan_status_callback = callback
 
@@ -919,22 +1360,59 @@ class ComdirectClient:
         """
         if self.tan_status_callback:
             try:
-                self.tan_status_callback(status, data)
+                self._track_callback_result(self.tan_status_callback(status, data), "TAN status")
             except Exception as e:
                 logger.error(f"Error in TAN status callback: {e}")
         else:
-            logger.debug(f"TAN status update: {status} - {data} (no callback registered)")
+            logger.debug("TAN status update: %s - %s (no callback registered)", status, data)
+
+    def _track_callback_result(self, result: Optional[Awaitable[None]], name: str) -> None:
+        """Run the awaitable returned by an async callback as a background task.
+
+        The event loop only keeps weak references to tasks, so the task is held
+        in a set until it finishes.
+
+        Args:
+            result: Return value of the callback
+            name: Callback name for error logging
+        """
+        if result is None or not inspect.isawaitable(result):
+            return
+        task = asyncio.ensure_future(result)
+        self._callback_tasks.add(task)
+        task.add_done_callback(partial(self._callback_task_done, name))
+
+    def _callback_task_done(self, name: str, task: "asyncio.Future[None]") -> None:
+        """Forget a finished callback task and log its error, if any."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error in {name} callback: {task.exception()}")
 
     async def close(self) -> None:
-        """Close the HTTP client and cleanup resources."""
-        if self._refresh_task and not self._refresh_task.done():
-            self._refresh_task.cancel()
+        """Close the HTTP client and cleanup resources.
+
+        Calling close() again after the client has been closed does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._cancel_scheduled_refresh()
+        await self._cancel_refresh_task()
+
+        # The shared refresh is shielded from its callers, so cancel it directly;
+        # otherwise it would keep running and store tokens on the closed client
+        in_flight, self._refresh_in_flight = self._refresh_in_flight, None
+        if in_flight is not None and not in_flight.done():
+            in_flight.cancel()
+            await self._await_cancelled(in_flight)
 
         await self._http_client.aclose()
         logger.info("ComdirectClient closed")
 
     async def __aenter__(self) -> "ComdirectClient":
         """Async context manager entry."""
+        self._ensure_refresh_scheduled()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
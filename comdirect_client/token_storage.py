@@ -6,16 +6,34 @@ to/from persistent storage, enabling session recovery after application restart.
 
 import json
 import logging
+import os
+import secrets
+import tempfile
+import time
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
+try:
+    # Optional faster JSON decoder for the token file (``orjson`` extra)
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Seconds after which a refresh lock left behind by a crashed process is considered stale.
+# Must exceed the longest time a refresh may legitimately hold the lock, i.e. the HTTP
+# request timeout (30s by default in ComdirectClient) plus reading and writing the token file.
+REFRESH_LOCK_TTL_SECONDS = 60
 
-def utc_now() -> datetime:
-    """Get current UTC time as timezone-aware datetime."""
-    return datetime.now(timezone.utc)
+_REQUIRED_FIELDS = ("access_token", "refresh_token", "token_expiry")
+# Pulls all required fields out of the token file data in a single call
+_TOKEN_FIELDS = itemgetter(*_REQUIRED_FIELDS)
+# Token file layout with the keys pre-serialized; only the JSON-encoded values are spliced in.
+# Produces the same output as json.dumps() of the equivalent dict.
+_TOKEN_FILE_TEMPLATE = '{"access_token": %s, "refresh_token": %s, "token_expiry": %s}'
 
 
 class TokenStorageError(Exception):
@@ -59,6 +77,13 @@ class TokenPersistence:
             TokenStorageError: If storage_path directory doesn't exist.
         """
         self.storage_path: Optional[Path] = None
+        # Last loaded tokens, keyed by the (inode, mtime, size) of the file they came from
+        self._cached_tokens: Optional[tuple[tuple[int, int, int], tuple[str, str, datetime]]] = None
+        # Paths derived from storage_path, computed once instead of on every save/lock call
+        self._storage_dir: Optional[str] = None
+        self._lock_path: Optional[Path] = None
+        # Token written into the refresh lock file while this instance holds the lock
+        self._lock_owner: Optional[bytes] = None
 
         if storage_path:
             path = Path(storage_path)
@@ -74,7 +99,9 @@ class TokenPersistence:
                 )
 
             self.storage_path = path
-            logger.debug(f"Token persistence enabled at: {self.storage_path.absolute()}")
+            self._storage_dir = str(parent)
+            self._lock_path = path.with_name(path.name + ".refresh.lock")
+            logger.debug("Token persistence enabled at: %s", self.storage_path.absolute())
 
     def save_tokens(
         self,
@@ -84,6 +111,10 @@ class TokenPersistence:
     ) -> None:
         """Save tokens to persistent storage.
 
+        The tokens are written to a temporary sibling file created with
+        ``tempfile.mkstemp`` which then replaces the storage file, so a crash
+        mid-write never leaves a truncated file.
+
         Args:
             access_token: OAuth2 access token
             refresh_token: OAuth2 refresh token
@@ -96,21 +127,34 @@ class TokenPersistence:
             return
 
         try:
-            token_data = {
-                "access_token": access_token,
-                "refresh_token": refresh_token,
-                "token_expiry": token_expiry.isoformat(),
-            }
+            expiry_iso = token_expiry.isoformat()
+            payload = _TOKEN_FILE_TEMPLATE % (
+                json.dumps(access_token),
+                json.dumps(refresh_token),
+                json.dumps(expiry_iso),
+            )
 
-            with open(self.storage_path, "w") as f:
-                json.dump(token_data, f)
+            # A uniquely named temp file, so processes saving at the same time never
+            # write into each other's temp file. mkstemp creates it with mode 0o600
+            # (owner read/write only), so no separate chmod is needed.
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=self.storage_path.name + ".", suffix=".tmp", dir=self._storage_dir
+            )
+            try:
+                # Serialize up front so the file is written with a single write() call
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload.encode())
 
-            # Set restrictive file permissions (owner read/write only)
-            self.storage_path.chmod(0o600)
+                os.replace(tmp_name, self.storage_path)
+                self._cached_tokens = None
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
 
             logger.debug(
-                f"Tokens saved to {self.storage_path.name} "
-                f"(expires: {token_expiry.isoformat()})"
+                "Tokens saved to %s (expires: %s)",
+                self.storage_path.name,
+                expiry_iso,
             )
 
         except (IOError, OSError) as e:
@@ -121,6 +165,10 @@ class TokenPersistence:
     ) -> Optional[tuple[str, str, datetime]]:
         """Load tokens from persistent storage.
 
+        The parsed tokens are cached in memory. As long as the file's inode,
+        modification time and size are unchanged, repeated calls only stat()
+        the file instead of reading and parsing it again.
+
         Returns:
             Tuple of (access_token, refresh_token, token_expiry) if tokens exist
             and are valid, None otherwise.
@@ -131,24 +179,32 @@ class TokenPersistence:
         if not self.storage_path:
             return None
 
-        if not self.storage_path.exists():
-            logger.debug(f"No token storage file found at {self.storage_path}")
+        try:
+            stat = self.storage_path.stat()
+        except FileNotFoundError:
+            logger.debug("No token storage file found at %s", self.storage_path)
             return None
+        except OSError as e:
+            raise TokenStorageError(f"Failed to read tokens: {e}")
+
+        file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if self._cached_tokens is not None and self._cached_tokens[0] == file_key:
+            return self._cached_tokens[1]
 
         try:
-            with open(self.storage_path, "r") as f:
-                token_data = json.load(f)
+            token_data = json_loads(self.storage_path.read_bytes())
 
-            # Validate required fields
-            required_fields = {"access_token", "refresh_token", "token_expiry"}
-            if not all(field in token_data for field in required_fields):
+            # Extract required fields; only a malformed file pays for listing what is missing
+            try:
+                access_token, refresh_token, expiry_iso = _TOKEN_FIELDS(token_data)
+            except KeyError:
+                missing = [field for field in _REQUIRED_FIELDS if field not in token_data]
                 raise TokenStorageError(
-                    f"Invalid token file format. Missing fields: "
-                    f"{required_fields - set(token_data.keys())}"
-                )
+                    f"Invalid token file format. Missing fields: {missing}"
+                ) from None
 
-            # Parse token expiry
-            token_expiry = datetime.fromisoformat(token_data["token_expiry"])
+            # Parse token expiry; the stored ISO string is reused for logging
+            token_expiry = datetime.fromisoformat(expiry_iso)
 
             # Ensure token_expiry is timezone-aware (assume UTC if naive)
             if token_expiry.tzinfo is None:
@@ -156,19 +212,17 @@ class TokenPersistence:
 
             # Load tokens even if expired - the refresh mechanism will handle it
             # The refresh_token may still be valid and can be used to get a new access_token
-            if token_expiry <= utc_now():
+            if token_expiry.timestamp() <= time.time():
                 logger.info(
-                    f"Loaded tokens are expired (expired: {token_expiry.isoformat()}), "
-                    "but refresh_token may still be valid"
+                    "Loaded tokens are expired (expired: %s), but refresh_token may still be valid",
+                    expiry_iso,
                 )
             else:
-                logger.debug(f"Tokens loaded from storage (expires: {token_expiry.isoformat()})")
+                logger.debug("Tokens loaded from storage (expires: %s)", expiry_iso)
 
-            return (
-                token_data["access_token"],
-                token_data["refresh_token"],
-                token_expiry,
-            )
+            tokens = (access_token, refresh_token, token_expiry)
+            self._cached_tokens = (file_key, tokens)
+            return tokens
 
         except json.JSONDecodeError as e:
             raise TokenStorageError(f"Token file is corrupted (invalid JSON): {e}")
@@ -177,6 +231,113 @@ class TokenPersistence:
         except (IOError, OSError) as e:
             raise TokenStorageError(f"Failed to read tokens: {e}")
 
+    def acquire_refresh_lock(self, ttl_seconds: float = REFRESH_LOCK_TTL_SECONDS) -> bool:
+        """Acquire the inter-process token refresh lock.
+
+        The lock is a ``.refresh.lock`` file next to the token file, created
+        exclusively so that only one process sharing the storage path refreshes
+        at a time. A lock older than ``ttl_seconds`` is treated as left behind by
+        a crashed process and taken over (see _remove_stale_lock). The file holds
+        a random owner token, so release_refresh_lock() never removes a lock
+        another process has taken over.
+
+        Args:
+            ttl_seconds: Age in seconds after which an existing lock is stale
+
+        Returns:
+            True if the lock was acquired (or no persistence is configured),
+            False if another process currently holds it.
+        """
+        lock_path = self._lock_path
+        if lock_path is None:
+            return True
+
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                if not self._remove_stale_lock(lock_path, ttl_seconds):
+                    return False
+                continue
+            except OSError as e:
+                # Don't block refreshes if the lock file can't be created at all
+                logger.warning("Failed to create token refresh lock: %s", e)
+                return True
+            owner = secrets.token_hex(16).encode()
+            try:
+                os.write(fd, owner)
+            finally:
+                os.close(fd)
+            self._lock_owner = owner
+            return True
+        return False
+
+    @staticmethod
+    def _remove_stale_lock(lock_path: Path, ttl_seconds: float) -> bool:
+        """Remove the refresh lock if it is older than ``ttl_seconds``.
+
+        Checking the age and then unlinking the path is racy: in between, another
+        process may remove the stale lock and create a fresh one, which would then
+        be deleted instead. So the lock is first renamed to a unique name, which
+        only one process can do, and only deleted if it is still the same file
+        whose age was checked. Otherwise it is linked back into place.
+
+        Args:
+            lock_path: Path of the refresh lock file
+            ttl_seconds: Age in seconds after which the lock is stale
+
+        Returns:
+            True if the lock is gone, False if a live lock is still held
+        """
+        try:
+            stat = lock_path.stat()
+        except FileNotFoundError:
+            return True  # Released in the meantime
+        lock_age = time.time() - stat.st_mtime
+        if lock_age < ttl_seconds:
+            return False
+
+        claimed = lock_path.with_name(f"{lock_path.name}.{secrets.token_hex(8)}.stale")
+        try:
+            os.rename(lock_path, claimed)
+        except FileNotFoundError:
+            return True  # Another process removed it first
+
+        try:
+            # Inode numbers are reused once a file is deleted, so compare the mtime too
+            claimed_stat = os.stat(claimed)
+            if (claimed_stat.st_ino, claimed_stat.st_mtime_ns) == (stat.st_ino, stat.st_mtime_ns):
+                logger.warning("Removing stale token refresh lock (%.0fs old)", lock_age)
+                return True
+            # A fresh lock was created after the age check; put it back
+            try:
+                os.link(claimed, lock_path)
+            except OSError as e:
+                logger.warning("Failed to restore token refresh lock: %s", e)
+            return False
+        finally:
+            claimed.unlink(missing_ok=True)
+
+    def release_refresh_lock(self) -> None:
+        """Release the inter-process token refresh lock.
+
+        The lock file is only removed if it still holds this instance's owner
+        token, i.e. it has not been taken over as stale by another process.
+        """
+        owner, self._lock_owner = self._lock_owner, None
+        if self._lock_path is None or owner is None:
+            return
+
+        try:
+            if self._lock_path.read_bytes() != owner:
+                logger.warning("Token refresh lock was taken over by another process")
+                return
+            self._lock_path.unlink()
+        except FileNotFoundError:
+            logger.warning("Token refresh lock was removed by another process")
+        except OSError as e:
+            logger.error(f"Failed to release token refresh lock: {e}")
+
     def clear_tokens(self) -> None:
         """Delete the token storage file.
 
@@ -185,9 +346,9 @@ class TokenPersistence:
         if not self.storage_path:
             return
 
+        self._cached_tokens = None
         try:
-            if self.storage_path.exists():
-                self.storage_path.unlink()
-                logger.debug(f"Token storage cleared: {self.storage_path}")
+            self.storage_path.unlink(missing_ok=True)
+            logger.debug("Token storage cleared: %s", self.storage_path)
         except (IOError, OSError) as e:
             logger.error(f"Failed to clear token storage: {e}")
@@ -1,5 +1,7 @@
 """Pytest configuration for Comdirect API client tests."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 # Configure pytest-asyncio
@@ -17,3 +19,28 @@ def log_capture(caplog):
     """Fixture to capture and configure logging."""
     caplog.set_level("DEBUG")
     return caplog
+
+
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FrozenClock:
+    """Fake UTC clock that only moves when advanced explicitly."""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by the given number of seconds."""
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Freeze the client's utc_now() at FROZEN_NOW."""
+    clock = FrozenClock(FROZEN_NOW)
+    monkeypatch.setattr("comdirect_client.client.utc_now", clock)
+    return clock
@@ -1,6 +1,15 @@
 """Authentication interface and library configuration tests."""
 
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
 from comdirect_client.client import ComdirectClient
+from comdirect_client.exceptions import ServerError, TokenExpiredError, ValidationError
+
+# Attribute names looked up on the class, so properties like `api` are not evaluated
+_CLIENT_ATTRS = frozenset(dir(ComdirectClient))
 
 
 class TestLibraryInterface:
@@ -32,6 +41,32 @@ class TestLibraryInterface:
 
         assert client.base_url == "https://custom.api.comdirect.de"
 
+    def test_client_initialization_defers_spec_loading(self):
+        """Test the Swagger spec is not parsed until the Bravado client is needed."""
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+        )
+
+        assert client._bravado_client is None
+        assert client._swagger_client is client._bravado_client
+
+    @pytest.mark.asyncio
+    async def test_create_initializes_bravado_client(self):
+        """Test create() builds the Bravado client before returning."""
+        client = await ComdirectClient.create(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+        )
+
+        assert client._bravado_client is not None
+        assert "bankingV1GetAccountTransactions" in client._raw_endpoints
+        await client.close()
+
     def test_client_has_required_methods(self):
         """Test client has all required async methods."""
         client = ComdirectClient(
@@ -42,19 +77,20 @@ class TestLibraryInterface:
         )
 
         # Check async methods exist
-        assert hasattr(client, "authenticate")
-        assert callable(getattr(client, "authenticate"))
+        assert "authenticate" in _CLIENT_ATTRS
+        assert callable(client.authenticate)
 
-        assert hasattr(client, "api")
-        assert hasattr(client, "refresh_token")
-        assert callable(getattr(client, "refresh_token"))
+        # `api` raises until authenticated, so only check that the property exists
+        assert "api" in _CLIENT_ATTRS
+        assert "refresh_token" in _CLIENT_ATTRS
+        assert callable(client.refresh_token)
 
         # Check sync methods exist
-        assert hasattr(client, "is_authenticated")
-        assert callable(getattr(client, "is_authenticated"))
+        assert "is_authenticated" in _CLIENT_ATTRS
+        assert callable(client.is_authenticated)
 
-        assert hasattr(client, "register_reauth_callback")
-        assert callable(getattr(client, "register_reauth_callback"))
+        assert "register_reauth_callback" in _CLIENT_ATTRS
+        assert callable(client.register_reauth_callback)
 
     def test_is_authenticated_returns_false_initially(self):
         """Test is_authenticated returns False before authentication."""
@@ -103,3 +139,93 @@ class TestLibraryInterface:
         )
 
         assert client.reauth_callback == test_callback
+
+
+class TestTanPolling:
+    """Test TAN approval polling."""
+
+    @pytest.mark.asyncio
+    async def test_poll_interval_backs_off(self):
+        """Test TAN polling waits longer between successive polls."""
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+        )
+
+        responses = []
+        for status in ("PENDING", "PENDING", "PENDING", "AUTHENTICATED"):
+            response = Mock()
+            response.status_code = 200
+            response.content = f'{{"id": "challenge", "status": "{status}"}}'.encode()
+            responses.append(response)
+        client._http_client.get = AsyncMock(side_effect=responses)
+
+        with patch("comdirect_client.client.asyncio.sleep", new=AsyncMock()) as sleep:
+            await client._step4_poll_tan_approval("token", "/poll", "P_TAN_PUSH")
+
+        assert [c.args[0] for c in sleep.await_args_list] == [1, 1, 2, 2]
+        await client.close()
+
+
+class TestDirectCall:
+    """Test direct API calls bypassing Bravado."""
+
+    @pytest.mark.asyncio
+    async def test_call_builds_url_from_operation_id(self):
+        """Test call() fills path parameters and passes the rest as query."""
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+        )
+        client._access_token = "access_token"
+        client._token_expiry = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"values": []}'
+        response.json = Mock(return_value={"values": []})
+        client._http_client.request = AsyncMock(return_value=response)
+
+        result = await client.call(
+            "bankingV1GetAccountTransactions",
+            {"accountId": "ACC 1", "transactionState": "BOOKED"},
+        )
+
+        assert result == {"values": []}
+        args, kwargs = client._http_client.request.call_args
+        assert args == (
+            "GET",
+            "https://api.comdirect.de/api/banking/v1/accounts/ACC%201/transactions",
+        )
+        assert kwargs["params"] == {"transactionState": "BOOKED"}
+        assert kwargs["headers"]["Authorization"] == "Bearer access_token"
+        await client.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status_code,expected",
+        [(401, TokenExpiredError), (422, ValidationError), (503, ServerError)],
+    )
+    async def test_call_maps_error_status_to_exception(self, status_code, expected):
+        """Test call() raises the package exception matching the error status."""
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+        )
+        client._access_token = "access_token"
+        client._token_expiry = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        response = Mock()
+        response.status_code = status_code
+        response.text = "error"
+        client._http_client.request = AsyncMock(return_value=response)
+
+        with pytest.raises(expected):
+            await client.call("bankingV1GetAccountTransactions", {"accountId": "ACC1"})
+        await client.close()
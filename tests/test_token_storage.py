@@ -1,11 +1,15 @@
 """Tests for token persistence functionality."""
 
+import asyncio
 import pytest
 import tempfile
 import json
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
 
+from comdirect_client.client import ComdirectClient
 from comdirect_client.token_storage import (
     TokenPersistence,
     TokenStorageError,
@@ -20,16 +24,16 @@ def utc_now() -> datetime:
 class TestTokenPersistence:
     """Test token persistence save/load functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def temp_dir(self):
-        """Create a temporary directory for tests."""
+        """Create a temporary directory shared by all tests in the session."""
         with tempfile.TemporaryDirectory() as tmpdir:
             yield tmpdir
 
     @pytest.fixture
-    def storage_path(self, temp_dir):
-        """Create a path for token storage."""
-        return str(Path(temp_dir) / "tokens.json")
+    def storage_path(self, temp_dir, request):
+        """Create a path for token storage, unique to each test."""
+        return str(Path(temp_dir) / f"tokens_{request.node.name}.json")
 
     def test_init_no_path(self):
         """Test TokenPersistence with no path (no persistence)."""
@@ -159,6 +163,104 @@ class TestTokenPersistence:
         perms = file_mode & 0o777
         assert perms == 0o600, f"Expected 0o600 but got {oct(perms)}"
 
+    def test_save_leaves_no_temp_file(self, storage_path):
+        """Test that saving replaces the file atomically without leftovers."""
+        persistence = TokenPersistence(storage_path=storage_path)
+
+        persistence.save_tokens("access", "refresh", utc_now() + timedelta(hours=1))
+
+        # The directory is shared between tests, so only look at this test's files
+        name = Path(storage_path).name
+        files = [p.name for p in Path(storage_path).parent.iterdir() if p.name.startswith(name)]
+        assert files == [name]
+
+    def test_load_is_cached_until_file_changes(self, storage_path):
+        """Test repeated loads reuse the parsed tokens until another writer replaces the file."""
+        persistence = TokenPersistence(storage_path=storage_path)
+        persistence.save_tokens("access1", "refresh1", utc_now() + timedelta(hours=1))
+
+        loaded = persistence.load_tokens()
+        assert persistence.load_tokens() is loaded
+
+        TokenPersistence(storage_path).save_tokens(
+            "access2", "refresh2", utc_now() + timedelta(hours=1)
+        )
+        reloaded = persistence.load_tokens()
+        assert reloaded is not None
+        assert reloaded[:2] == ("access2", "refresh2")
+
+    def test_refresh_lock_is_exclusive(self, storage_path):
+        """Test that only one holder gets the refresh lock until it is released."""
+        first = TokenPersistence(storage_path=storage_path)
+        second = TokenPersistence(storage_path=storage_path)
+
+        assert first.acquire_refresh_lock()
+        assert not second.acquire_refresh_lock()
+
+        first.release_refresh_lock()
+        assert second.acquire_refresh_lock()
+        second.release_refresh_lock()
+
+    def test_stale_refresh_lock_is_taken_over(self, storage_path):
+        """Test that a lock older than the TTL is treated as abandoned."""
+        persistence = TokenPersistence(storage_path=storage_path)
+        assert persistence.acquire_refresh_lock()
+
+        lock_path = Path(storage_path + ".refresh.lock")
+        stale = lock_path.stat().st_mtime - 60
+        os.utime(lock_path, (stale, stale))
+
+        assert persistence.acquire_refresh_lock(ttl_seconds=30)
+        persistence.release_refresh_lock()
+        assert not lock_path.exists()
+
+    def test_stale_lock_takeover_keeps_lock_created_meanwhile(self, storage_path):
+        """Test a fresh lock created after the staleness check is not removed."""
+        slow = TokenPersistence(storage_path=storage_path)
+        other = TokenPersistence(storage_path=storage_path)
+        third = TokenPersistence(storage_path=storage_path)
+        assert slow.acquire_refresh_lock()
+
+        lock_path = Path(storage_path + ".refresh.lock")
+        stale = lock_path.stat().st_mtime - 120
+        os.utime(lock_path, (stale, stale))
+
+        real_rename = os.rename
+
+        def takeover_before_rename(src, dst):
+            # Another process removes the stale lock and a third one creates a fresh lock
+            if Path(src) == lock_path:
+                lock_path.unlink()
+                assert third.acquire_refresh_lock()
+            real_rename(src, dst)
+
+        with patch("comdirect_client.token_storage.os.rename", side_effect=takeover_before_rename):
+            assert not other.acquire_refresh_lock()
+
+        assert lock_path.exists()
+        assert sorted(p.name for p in lock_path.parent.glob(lock_path.name + "*")) == [
+            lock_path.name
+        ]
+        third.release_refresh_lock()
+        assert not lock_path.exists()
+
+    def test_release_keeps_lock_taken_over_by_another_process(self, storage_path):
+        """Test a holder whose stale lock was taken over does not remove the new lock."""
+        slow = TokenPersistence(storage_path=storage_path)
+        other = TokenPersistence(storage_path=storage_path)
+        assert slow.acquire_refresh_lock()
+
+        lock_path = Path(storage_path + ".refresh.lock")
+        stale = lock_path.stat().st_mtime - 60
+        os.utime(lock_path, (stale, stale))
+        assert other.acquire_refresh_lock(ttl_seconds=30)
+
+        slow.release_refresh_lock()
+        assert lock_path.exists()
+
+        other.release_refresh_lock()
+        assert not lock_path.exists()
+
     def test_no_persistence_save(self):
         """Test save with no persistence configured."""
         persistence = TokenPersistence(storage_path=None)
@@ -194,6 +296,21 @@ class TestTokenPersistence:
         _, _, loaded_expiry = loaded
         assert loaded_expiry == original_expiry
 
+    def test_saved_file_matches_json_dumps(self, storage_path):
+        """Test the saved file is valid JSON even for token values that need escaping."""
+        persistence = TokenPersistence(storage_path=storage_path)
+        expiry = datetime(2025, 12, 10, 15, 30, 45, tzinfo=timezone.utc)
+
+        persistence.save_tokens('acc"ess\\token', "refresh\n", expiry)
+
+        assert Path(storage_path).read_text() == json.dumps(
+            {
+                "access_token": 'acc"ess\\token',
+                "refresh_token": "refresh\n",
+                "token_expiry": expiry.isoformat(),
+            }
+        )
+
     def test_multiple_save_overwrites(self, storage_path):
         """Test that multiple saves overwrite previous tokens."""
         persistence = TokenPersistence(storage_path=storage_path)
@@ -217,16 +334,14 @@ class TestTokenPersistenceIntegration:
     @pytest.fixture
     def temp_token_file(self):
         """Create a temporary token file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = f.name
+        fd, temp_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
         yield temp_path
         # Cleanup
         Path(temp_path).unlink(missing_ok=True)
 
     def test_client_init_with_token_storage_path(self, temp_token_file):
         """Test ComdirectClient initialization with token_storage_path."""
-        from comdirect_client import ComdirectClient
-
         client = ComdirectClient(
             client_id="test_id",
             client_secret="test_secret",
@@ -240,8 +355,6 @@ class TestTokenPersistenceIntegration:
 
     def test_client_init_invalid_storage_path(self):
         """Test ComdirectClient initialization with invalid storage path."""
-        from comdirect_client import ComdirectClient
-
         with pytest.raises(TokenStorageError):
             ComdirectClient(
                 client_id="test_id",
@@ -253,8 +366,6 @@ class TestTokenPersistenceIntegration:
 
     def test_client_init_no_token_storage_path(self):
         """Test ComdirectClient initialization without token_storage_path."""
-        from comdirect_client import ComdirectClient
-
         client = ComdirectClient(
             client_id="test_id",
             client_secret="test_secret",
@@ -265,10 +376,65 @@ class TestTokenPersistenceIntegration:
         assert client._token_storage is not None
         assert client._token_storage.storage_path is None
 
-    def test_clear_token_storage_on_close(self, temp_token_file):
-        """Test that token storage can be cleared."""
-        from comdirect_client import ComdirectClient
+    def test_restored_tokens_refresh_scheduled_on_first_call(self, tmp_path):
+        """Test tokens restored outside of an event loop get refreshed after the first call."""
+        storage_path = str(tmp_path / "tokens.json")
+        TokenPersistence(storage_path=storage_path).save_tokens(
+            "access", "refresh", utc_now() + timedelta(hours=1)
+        )
 
+        # Constructed outside of an event loop, so no refresh timer can be armed yet
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+            token_storage_path=storage_path,
+        )
+        assert client.is_authenticated()
+        assert client._refresh_handle is None
+
+        async def first_call():
+            response = Mock()
+            response.status_code = 200
+            response.content = b"{}"
+            client._http_client.request = AsyncMock(return_value=response)
+            await client.call("bankingV1GetAccountTransactions", {"accountId": "ACC1"})
+            scheduled = client._refresh_handle is not None
+            await client.close()
+            return scheduled
+
+        assert asyncio.run(first_call())
+
+    @pytest.mark.asyncio
+    async def test_client_does_not_take_over_lock_within_request_timeout(self, temp_token_file):
+        """Test a lock held for the whole request timeout is not treated as stale."""
+        client = ComdirectClient(
+            client_id="test_id",
+            client_secret="test_secret",
+            username="test_user",
+            password="test_pass",
+            timeout_seconds=45,
+            token_storage_path=temp_token_file,
+        )
+        other_process = TokenPersistence(storage_path=temp_token_file)
+        assert other_process.acquire_refresh_lock()
+
+        # The other process is still waiting for its refresh response
+        lock_path = Path(temp_token_file + ".refresh.lock")
+        slow = lock_path.stat().st_mtime - 45
+        os.utime(lock_path, (slow, slow))
+
+        try:
+            assert not await client._acquire_storage_refresh_lock()
+        finally:
+            other_process.release_refresh_lock()
+            await client.close()
+        assert not lock_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_clear_token_storage_on_close(self, temp_token_file):
+        """Test that token storage can be cleared."""
         client = ComdirectClient(
             client_id="test_id",
             client_secret="test_secret",
@@ -281,7 +447,7 @@ class TestTokenPersistenceIntegration:
         client._access_token = "test_token"
         client._refresh_token = "test_refresh"
         client._token_expiry = utc_now() + timedelta(hours=1)
-        client._save_tokens_to_storage()
+        await client._save_tokens_to_storage_async()
 
         # Verify file exists
         assert Path(temp_token_file).exists()